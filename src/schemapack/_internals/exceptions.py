@@ -110,7 +110,7 @@ class ValidationPluginError(BaseError, ValueError):
         self.details = details if details else {}
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationErrorRecord:
     """A record of an Error occuring during validation on a specific context
     (e.g. a specific resource) regarding a specific validation aspect.
@@ -38,6 +38,12 @@ from schemapack._internals.spec.custom_types import (
 SupportedDataPackVersions = Literal["0.3.0"]
 SUPPORTED_DATA_PACK_VERSIONS = typing.get_args(SupportedDataPackVersions)
 
+# shared instance returned for relations without any targets:
+_EMPTY_ID_SET: frozenset[ResourceId] = frozenset()
+
+# shared instance used as fallback for classes without resources in a datapack:
+_EMPTY_RESOURCES: FrozenDict[ResourceId, "Resource"] = FrozenDict()
+
 
 def validate_duplicate_target_ids(iterable: Iterable) -> Any:
     """Checks that the given iterable of target IDs does not contain duplicates. If it
@@ -56,6 +62,10 @@ def validate_duplicate_target_ids(iterable: Iterable) -> Any:
             {"iterable": iterable},
         ) from error
 
+    if len(set(target_id_list)) == len(target_id_list):
+        # Duplicates are the exception, so only count occurrences if there are any:
+        return iterable
+
     counter = Counter(target_id_list)
     duplicates = {k for k, v in counter.items() if v > 1}
 
@@ -132,11 +142,11 @@ class Resource(_FrozenNoExtraBaseModel):
             targets = self.relations[relation_name]
         except KeyError:
             if do_not_raise:
-                return frozenset()
+                return _EMPTY_ID_SET
             raise
 
         if targets is None:
-            return frozenset()
+            return _EMPTY_ID_SET
         if isinstance(targets, frozenset):
             return targets
         return frozenset({targets})
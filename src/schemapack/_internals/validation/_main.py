@@ -129,7 +129,7 @@ def _run_class_plugins(
     records: list[ValidationErrorRecord] = []
 
     for class_name, class_resources in datapack.resources.items():
-        for plugin in plugins.get(class_name, []):
+        for plugin in plugins.get(class_name, ()):
             try:
                 plugin.validate(class_resources=class_resources, datapack=datapack)
             except ValidationPluginError as error:
@@ -145,8 +145,9 @@ def _run_resource_plugins(
     records: list[ValidationErrorRecord] = []
 
     for class_name, class_resources in datapack.resources.items():
+        class_plugins = plugins.get(class_name, ())
         for resource_id, resource in class_resources.items():
-            for plugin in plugins.get(class_name, []):
+            for plugin in class_plugins:
                 try:
                     plugin.validate(
                         resource_id=resource_id, resource=resource, datapack=datapack
@@ -36,6 +36,9 @@ class GlobalValidationPlugin(ABC):
     aspect that applies to the entire datapack.
     """
 
+    # allows stateless plugins to do without an instance __dict__:
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def does_apply(*, schemapack: SchemaPack) -> bool:
@@ -17,12 +17,13 @@
 """A validation plugin."""
 
 import json
-from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import jsonschema.exceptions
 import jsonschema.protocols
 import jsonschema.validators
+from arcticfreeze import FrozenDict
 
 from schemapack._internals.validation.base import ResourceValidationPlugin
 from schemapack.exceptions import ValidationPluginError
@@ -31,19 +32,38 @@ from schemapack.spec.datapack import DataPack, Resource
 from schemapack.spec.schemapack import ClassDefinition
 
 
-def _get_json_schema_validator(
-    schema: Mapping[str, Any],
+@lru_cache(maxsize=128)
+def _build_json_schema_validator(
+    serialized_schema: str,
 ) -> jsonschema.protocols.Validator:
-    """Get a JSON Schema validator for the given schema.
-    It is assumed that the schema has already been checked for validity against the
-    JSON Schema specs.
+    """Build a JSON Schema validator for the given JSON-serialized schema.
+
+    Validators are cached per serialized schema, so that validators created for the
+    same schemapack repeatedly (e.g. when validating multiple datapacks) can reuse the
+    already prepared validator. The cache is bounded so that long-running processes
+    dealing with many different schemapacks do not keep all of them alive.
     """
+    schema = json.loads(serialized_schema)
     cls: type[jsonschema.protocols.Validator] = jsonschema.validators.validator_for(
         schema
     )
     return cls(schema)
 
 
+def _get_json_schema_validator(
+    schema: FrozenDict[str, Any],
+) -> jsonschema.protocols.Validator:
+    """Get a JSON Schema validator for the given schema.
+    It is assumed that the schema has already been checked for validity against the
+    JSON Schema specs.
+    """
+    # The frozen schema itself is not a suitable cache key as Python considers e.g.
+    # `True == 1` (with equal hashes), while JSON Schema does not. Thus, a canonical
+    # JSON serialization of the schema is used as key instead:
+    serialized_schema = json.dumps(schema, sort_keys=True, default=dict)
+    return _build_json_schema_validator(serialized_schema)
+
+
 class ContentSchemaValidationPlugin(ResourceValidationPlugin):
     """A resource-scoped validation plugin validating the content of one resource
     against the content JSON Schema defined in the corresponding schemapack.
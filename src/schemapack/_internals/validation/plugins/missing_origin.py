@@ -18,6 +18,7 @@
 
 from collections.abc import Mapping
 
+from schemapack._internals.spec.datapack import _EMPTY_RESOURCES
 from schemapack._internals.validation.base import ClassValidationPlugin
 from schemapack.exceptions import ValidationPluginError
 from schemapack.spec.custom_types import ResourceId
@@ -71,13 +72,12 @@ class MissingMandatoryOriginValidationPlugin(ClassValidationPlugin):
                 )
             }
 
-            all_possible_target_ids = set(
-                datapack.resources.get(relation.targetClass, {})
-            )
+            # the key view of the resources mapping supports set operations directly:
+            all_possible_target_ids = datapack.resources.get(
+                relation.targetClass, _EMPTY_RESOURCES
+            ).keys()
 
-            not_referenced_target_ids = all_possible_target_ids.difference(
-                referenced_target_ids
-            )
+            not_referenced_target_ids = all_possible_target_ids - referenced_target_ids
             if not_referenced_target_ids:
                 not_referenced_target_id_by_relation[relation_name] = (
                     not_referenced_target_ids
@@ -65,16 +65,18 @@ class TargetOverlapValidationPlugin(ClassValidationPlugin):
         # overlaps are found for that relation:
         overlapping_ids_by_relation: dict[str, set[str]] = {}
 
-        for relation_name in self._relations_of_interest:
-            counter: Counter[str] = Counter()
-
-            for resource in class_resources.values():
-                resource_target_ids = resource.get_target_id_set(
-                    relation_name, do_not_raise=True
+        # Count the target ids of all relations of interest in a single pass over the
+        # resources, so that each resource is only visited once:
+        counters: dict[str, Counter[str]] = {
+            relation_name: Counter() for relation_name in self._relations_of_interest
+        }
+        for resource in class_resources.values():
+            for relation_name, counter in counters.items():
+                counter.update(
+                    resource.get_target_id_set(relation_name, do_not_raise=True)
                 )
 
-                counter.update(resource_target_ids)
-
+        for relation_name, counter in counters.items():
             duplicate_target_ids = {k for k, v in counter.items() if v > 1}
 
             if duplicate_target_ids:
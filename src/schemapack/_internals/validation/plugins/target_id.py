@@ -16,6 +16,7 @@
 
 """A validation plugin."""
 
+from schemapack._internals.spec.datapack import _EMPTY_RESOURCES
 from schemapack._internals.validation.base import ResourceValidationPlugin
 from schemapack.exceptions import ValidationPluginError
 from schemapack.spec.custom_types import ResourceId
@@ -51,13 +52,20 @@ class TargetIdValidationPlugin(ResourceValidationPlugin):
         Raises:
             schemapack.exceptions.ValidationPluginError: If validation fails.
         """
-        non_found_target_ids: dict[str, str] = {}  # target_id -> relation_name
+        # pairs of (target_id, relation_name), the same target ID may occur for
+        # multiple relations:
+        non_found_target_ids: list[tuple[str, str]] = []
+        resources = datapack.resources
         for relation_name, relation in self._relations.items():
+            target_class_resources = resources.get(
+                relation.targetClass, _EMPTY_RESOURCES
+            )
+            is_existing_target = target_class_resources.__contains__
             target_ids = resource.get_target_id_set(relation_name, do_not_raise=True)
 
             for target_id in target_ids:
-                if target_id not in datapack.resources.get(relation.targetClass, set()):
-                    non_found_target_ids[target_id] = relation_name
+                if not is_existing_target(target_id):
+                    non_found_target_ids.append((target_id, relation_name))
 
         if non_found_target_ids:
             raise ValidationPluginError(
@@ -67,11 +75,15 @@ class TargetIdValidationPlugin(ResourceValidationPlugin):
                     + " names): "
                     + ", ".join(
                         f"'{target_id}' ('{relation_name}')"
-                        for target_id, relation_name in non_found_target_ids.items()
+                        for target_id, relation_name in non_found_target_ids
                     )
                 ),
                 details={
-                    "non_found_target_ids": non_found_target_ids.keys(),
-                    "corresponding_relation_names": non_found_target_ids.values(),
+                    "non_found_target_ids": [
+                        target_id for target_id, _ in non_found_target_ids
+                    ],
+                    "corresponding_relation_names": [
+                        relation_name for _, relation_name in non_found_target_ids
+                    ],
                 },
             )
@@ -28,6 +28,8 @@ class UnexpectedRootValidationPlugin(GlobalValidationPlugin):
     This plugin is only relevant if the schemapack has no root class defined.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def does_apply(*, schemapack: SchemaPack) -> bool:
         """A classmethod to check whether this validation plugin is relevant for the
@@ -35,7 +37,7 @@ class UnexpectedRootValidationPlugin(GlobalValidationPlugin):
 
         Returns: True if this plugin is relevant for the given class definition.
         """
-        return not bool(schemapack.rootClass)
+        return schemapack.rootClass is None
 
     def __init__(self, *, schemapack: SchemaPack):
         """This plugin is configured with the entire schemapack."""
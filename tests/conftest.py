@@ -0,0 +1,46 @@
+# Copyright 2021 - 2024 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from schemapack import load_datapack, load_schemapack
+from schemapack.spec.datapack import DataPack
+from schemapack.spec.schemapack import SchemaPack
+from tests.fixtures.examples import VALID_DATAPACK_PATHS, VALID_SCHEMAPACK_PATHS
+
+
+@pytest.fixture(scope="session")
+def parsed_schemapacks() -> dict[str, SchemaPack]:
+    """All valid example schemapacks, parsed only once per test session.
+
+    Schemapacks are immutable, so the instances can safely be shared across tests.
+    Tests that exercise the loading itself should call `load_schemapack` directly.
+    """
+    return {
+        name: load_schemapack(path) for name, path in VALID_SCHEMAPACK_PATHS.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def parsed_datapacks() -> dict[str, DataPack]:
+    """All valid example datapacks, parsed only once per test session.
+
+    Datapacks are immutable, so the instances can safely be shared across tests.
+    Tests that exercise the loading itself should call `load_datapack` directly.
+    """
+    return {name: load_datapack(path) for name, path in VALID_DATAPACK_PATHS.items()}
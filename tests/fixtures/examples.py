@@ -16,7 +16,10 @@
 
 """Example schemapack definitions and associated data."""
 
+import os
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 
 from tests.fixtures.utils import ROOT_DIR
 
@@ -36,19 +39,31 @@ denomalizated_suffix = ".denormalized.yaml"
 erd_suffix = ".mm.txt"
 
 
+@cache
+def _scan_examples_in_dir(dir: Path, suffix: str) -> tuple[tuple[str, Path], ...]:
+    """Scan the given dir for example files with the given suffix. The result is cached
+    so that every directory is only scanned once.
+
+    Returns:
+        A tuple of (example_name, path) pairs sorted by example name.
+    """
+    with os.scandir(dir) as entries:
+        examples = [
+            (entry.name.removesuffix(suffix), dir / entry.name)
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+
+    return tuple(sorted(examples))
+
+
 def list_examples_in_dir(dir: Path, *, suffix: str) -> dict[str, Path]:
     """List all example files with the given suffix in the given dir.
 
     Returns:
         A dict of {example_name: path}.
     """
-    examples = {
-        path.name.removesuffix(suffix): path
-        for path in dir.iterdir()
-        if path.name.endswith(suffix)
-    }
-
-    return dict(sorted(examples.items()))
+    return dict(_scan_examples_in_dir(dir, suffix))
 
 
 def list_examples_in_nested_dir(dir: Path, *, suffix: str) -> dict[str, Path]:
@@ -58,11 +73,13 @@ def list_examples_in_nested_dir(dir: Path, *, suffix: str) -> dict[str, Path]:
     Returns:
         A dict of {"subdir.example_name": path}.
     """
+    with os.scandir(dir) as entries:
+        subdirs = [dir / entry.name for entry in entries if not entry.is_file()]
+
     examples = {
         f"{subdir.name}.{example_name}": example
-        for subdir in dir.iterdir()
-        if not subdir.is_file()
-        for example_name, example in list_examples_in_dir(subdir, suffix=suffix).items()
+        for subdir in subdirs
+        for example_name, example in _scan_examples_in_dir(subdir, suffix)
     }
 
     return dict(sorted(examples.items()))
@@ -77,8 +94,10 @@ def list_schemapacks_in_dir(dir: Path) -> dict[str, Path]:
     return list_examples_in_dir(dir, suffix=schemapack_suffix)
 
 
-VALID_SCHEMAPACK_PATHS = list_schemapacks_in_dir(VALID_SCHEMAPACK_DIR)
-INVALID_SCHEMAPACK_PATHS = list_schemapacks_in_dir(INVALID_SCHEMAPACK_DIR)
+VALID_SCHEMAPACK_PATHS = MappingProxyType(list_schemapacks_in_dir(VALID_SCHEMAPACK_DIR))
+INVALID_SCHEMAPACK_PATHS = MappingProxyType(
+    list_schemapacks_in_dir(INVALID_SCHEMAPACK_DIR)
+)
 
 
 def list_datapacks_in_dir(dir: Path) -> dict[str, Path]:
@@ -90,8 +109,8 @@ def list_datapacks_in_dir(dir: Path) -> dict[str, Path]:
     return list_examples_in_nested_dir(dir, suffix=datapack_suffix)
 
 
-VALID_DATAPACK_PATHS = list_datapacks_in_dir(VALID_DATAPACK_DIR)
-INVALID_DATAPACK_PATHS = list_datapacks_in_dir(INVALID_DATAPACK_DIR)
+VALID_DATAPACK_PATHS = MappingProxyType(list_datapacks_in_dir(VALID_DATAPACK_DIR))
+INVALID_DATAPACK_PATHS = MappingProxyType(list_datapacks_in_dir(INVALID_DATAPACK_DIR))
 
 
 def list_denormalized_in_dir(dir: Path) -> dict[str, Path]:
@@ -103,7 +122,7 @@ def list_denormalized_in_dir(dir: Path) -> dict[str, Path]:
     return list_examples_in_nested_dir(dir, suffix=denomalizated_suffix)
 
 
-DENORMALIZED_PATHS = list_denormalized_in_dir(DENORMALIZED_DIR)
+DENORMALIZED_PATHS = MappingProxyType(list_denormalized_in_dir(DENORMALIZED_DIR))
 
 
 def list_erds_in_dir(dir: Path) -> dict[str, Path]:
@@ -115,4 +134,4 @@ def list_erds_in_dir(dir: Path) -> dict[str, Path]:
     return list_examples_in_dir(dir, suffix=erd_suffix)
 
 
-ERD_PATHS = list_erds_in_dir(ERD_DIR)
+ERD_PATHS = MappingProxyType(list_erds_in_dir(ERD_DIR))
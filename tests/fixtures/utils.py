@@ -16,33 +16,21 @@
 """Utils for Fixture handling."""
 
 import json
+from functools import cache
 from pathlib import Path
 
 import ruamel.yaml
 
-yaml = ruamel.yaml.YAML()
+from schemapack.utils import read_json_or_yaml_mapping
+
+# the outputs are only checked for validity and compared by value, so there is no
+# need for the round-trip loader, use the (C-based) safe loader instead:
+yaml = ruamel.yaml.YAML(typ="safe", pure=False)
 
 BASE_DIR = Path(__file__).parent.resolve()
 ROOT_DIR = BASE_DIR.parent.parent
 
 
-def is_valid_yaml(yaml_string: str):
-    """
-    Checks if the provided YAML string is valid.
-
-    Args:
-        yaml_string: The YAML string to validate.
-
-    Returns:
-        bool: True if the YAML is valid, False otherwise.
-    """
-    try:
-        yaml.load(yaml_string)
-        return True
-    except ruamel.yaml.YAMLError:
-        return False
-
-
 def is_valid_json(json_string: str):
     """
     Checks if the provided JSON string is valid.
@@ -62,7 +50,8 @@ def is_valid_json(json_string: str):
 
 def assert_formatted_string(string: str, json_format: bool):
     """
-    Asserts that the provided string is formatted in the expected format.
+    Asserts that the provided string is formatted in the expected format. The content
+    parsed during the check is returned, so that it does not need to be parsed again.
 
     Args:
         string:
@@ -70,13 +59,28 @@ def assert_formatted_string(string: str, json_format: bool):
         json_format:
             True if the string should be in JSON format, False if the string should be
             in YAML format.
+
+    Returns:
+        The content parsed from the string.
     """
     if json_format:
-        assert is_valid_json(string)
-    else:
-        assert is_valid_yaml(string)
+        try:
+            return json.loads(string)
+        except json.JSONDecodeError as error:
+            raise AssertionError(f"The string is not valid JSON: {error}") from error
+
+    try:
+        content = yaml.load(string)
+    except ruamel.yaml.YAMLError as error:
+        raise AssertionError(f"The string is not valid YAML: {error}") from error
+
+    # a mapping or sequence can only be valid JSON if it is in flow style, so
+    # block-style YAML does not need to be parsed a second time:
+    if string.lstrip().startswith(("{", "[")):
         assert not is_valid_json(string)
 
+    return content
+
 
 def loads_json_or_yaml_mapping(string: str):
     """
@@ -89,3 +93,35 @@ def loads_json_or_yaml_mapping(string: str):
         dict: The loaded mapping.
     """
     return yaml.load(string)
+
+
+@cache
+def read_expected_mapping(path: Path) -> dict:
+    """
+    Reads a JSON or YAML mapping describing an expected test outcome from file. The
+    result is cached, so that every file is only parsed once per test session.
+
+    Please note, the returned mapping is shared across tests and must not be modified.
+
+    Args:
+        path: The path to the JSON or YAML file.
+
+    Returns:
+        dict: The loaded mapping.
+    """
+    return read_json_or_yaml_mapping(path)
+
+
+@cache
+def read_expected_text(path: Path) -> str:
+    """
+    Reads a text file describing an expected test outcome. The result is cached, so
+    that every file is only read once per test session.
+
+    Args:
+        path: The path to the text file.
+
+    Returns:
+        str: The content of the file.
+    """
+    return path.read_bytes().decode("utf-8")
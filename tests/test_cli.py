@@ -24,12 +24,12 @@ python API (to avoid redundancy of tests).
 from pathlib import Path
 
 import pytest
-import ruamel.yaml
+import typer
 from typer.testing import CliRunner
 
 from schemapack import __version__ as schemapack_version
 from schemapack._internals.cli import cli
-from schemapack._internals.utils import read_json_or_yaml_mapping
+from schemapack._internals.cli.main import isolate_resource
 from schemapack.cli import exit_codes
 from tests.fixtures.examples import (
     ERD_PATHS,
@@ -40,10 +40,10 @@ from tests.fixtures.examples import (
 )
 from tests.fixtures.utils import (
     assert_formatted_string,
-    loads_json_or_yaml_mapping,
+    read_expected_mapping,
+    read_expected_text,
 )
 
-yaml = ruamel.yaml.YAML(typ="rt")
 runner = CliRunner(
     mix_stderr=False,
 )
@@ -70,78 +70,72 @@ def generate_validate_command(
 
 
 @pytest.mark.parametrize(
-    "abbreviate", [True, False], ids=["abbreviate", "no_abbreviate"]
-)
-def test_validate_valid(abbreviate: bool):
-    """Test the validate command with a valid datapack."""
-    schemapack = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    datapack = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-
-    result = runner.invoke(
-        cli,
-        generate_validate_command(
-            schemapack=schemapack, datapack=datapack, abbreviate=abbreviate
+    "schemapack, datapack, abbreviate, expected_exit_code, expected_stderr",
+    [
+        (
+            VALID_SCHEMAPACK_PATHS["simple_relations"],
+            VALID_DATAPACK_PATHS["simple_relations.simple_resources"],
+            True,
+            exit_codes.SUCCESS,
+            "The provided datapack is valid",
         ),
-    )
-    assert result.exit_code == exit_codes.SUCCESS == 0
-
-
-@pytest.mark.parametrize(
-    "abbreviate", [True, False], ids=["abbreviate", "no_abbreviate"]
-)
-def test_validate_invalid(abbreviate: bool):
-    """Test the validate command with an invalid datapack."""
-    schemapack = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    datapack = INVALID_DATAPACK_PATHS[
-        "simple_relations.ContentValidationError.missing_property"
-    ]
-
-    result = runner.invoke(
-        cli,
-        generate_validate_command(
-            schemapack=schemapack, datapack=datapack, abbreviate=abbreviate
+        (
+            VALID_SCHEMAPACK_PATHS["simple_relations"],
+            VALID_DATAPACK_PATHS["simple_relations.simple_resources"],
+            False,
+            exit_codes.SUCCESS,
+            "The provided datapack is valid",
         ),
-    )
-    assert result.exit_code == exit_codes.VALIDATION_ERROR != 0
-    assert "ContentValidationError" in result.stderr
-
-
-@pytest.mark.parametrize(
-    "abbreviate", [True, False], ids=["abbreviate", "no_abbreviate"]
-)
-def test_validate_datapack_spec_error(abbreviate: bool):
-    """Test the validate command with a datapack that does not comply with the specs."""
-    schemapack = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    datapack = INVALID_DATAPACK_PATHS[
-        "simple_relations.DataPackSpecError.DuplicateTargetIdError"
-    ]
-
-    result = runner.invoke(
-        cli,
-        generate_validate_command(
-            schemapack=schemapack, datapack=datapack, abbreviate=abbreviate
+        (
+            VALID_SCHEMAPACK_PATHS["simple_relations"],
+            INVALID_DATAPACK_PATHS[
+                "simple_relations.ContentValidationError.missing_property"
+            ],
+            False,
+            exit_codes.VALIDATION_ERROR,
+            "ContentValidationError",
         ),
-    )
-    assert result.exit_code == exit_codes.DATAPACK_SPEC_ERROR != 0
-    assert "DataPackSpecError" in result.stderr
-
-
-@pytest.mark.parametrize(
-    "abbreviate", [True, False], ids=["abbreviate", "no_abbreviate"]
+        (
+            VALID_SCHEMAPACK_PATHS["simple_relations"],
+            INVALID_DATAPACK_PATHS[
+                "simple_relations.DataPackSpecError.DuplicateTargetIdError"
+            ],
+            False,
+            exit_codes.DATAPACK_SPEC_ERROR,
+            "DataPackSpecError",
+        ),
+        (
+            INVALID_SCHEMAPACK_PATHS["ContentSchemaNotFoundError"],
+            VALID_DATAPACK_PATHS["simple_relations.simple_resources"],
+            False,
+            exit_codes.SCHEMAPACK_SPEC_ERROR,
+            "SchemaPackSpecError",
+        ),
+    ],
+    ids=[
+        "valid_abbreviate",
+        "valid_no_abbreviate",
+        "invalid",
+        "datapack_spec_error",
+        "schemapack_spec_error",
+    ],
 )
-def test_validate_schemapack_spec_error(abbreviate: bool):
-    """Test the validate command with a schemapack that does not comply with the specs."""
-    schemapack = INVALID_SCHEMAPACK_PATHS["ContentSchemaNotFoundError"]
-    datapack = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-
+def test_validate(
+    schemapack: Path,
+    datapack: Path,
+    abbreviate: bool,
+    expected_exit_code: int,
+    expected_stderr: str,
+):
+    """Test the validate command with valid and invalid inputs."""
     result = runner.invoke(
         cli,
         generate_validate_command(
             schemapack=schemapack, datapack=datapack, abbreviate=abbreviate
         ),
     )
-    assert result.exit_code == exit_codes.SCHEMAPACK_SPEC_ERROR != 0
-    assert "SchemaPackSpecError" in result.stderr
+    assert result.exit_code == expected_exit_code
+    assert expected_stderr in result.stderr
 
 
 def test_check_schemapack_complies():
@@ -150,6 +144,7 @@ def test_check_schemapack_complies():
 
     result = runner.invoke(cli, ["check-schemapack", str(schemapack)])
     assert result.exit_code == exit_codes.SUCCESS == 0
+    assert "complies with the specs of a schemapack" in result.stderr
 
 
 def test_check_schemapack_not_complies():
@@ -167,6 +162,7 @@ def test_check_datapack_complies():
 
     result = runner.invoke(cli, ["check-datapack", str(datapack)])
     assert result.exit_code == exit_codes.SUCCESS == 0
+    assert "complies with the specs of a datapack" in result.stderr
 
 
 def test_check_datapack_not_complies():
@@ -188,7 +184,7 @@ def test_check_datapack_not_complies():
 def test_condense_schemapack(json_format: bool, abbreviate: bool):
     """Test the condense-schemapack command."""
     schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    expected_dict = read_json_or_yaml_mapping(
+    expected_dict = read_expected_mapping(
         VALID_SCHEMAPACK_PATHS["simple_relations_condensed"]
     )
 
@@ -199,9 +195,7 @@ def test_condense_schemapack(json_format: bool, abbreviate: bool):
     assert result.exit_code == exit_codes.SUCCESS == 0
 
     observed_str = result.stdout
-    assert_formatted_string(observed_str, json_format=json_format)
-
-    observed_dict = loads_json_or_yaml_mapping(observed_str)
+    observed_dict = assert_formatted_string(observed_str, json_format=json_format)
     assert observed_dict == expected_dict
 
 
@@ -214,7 +208,7 @@ def test_isolate_resource(json_format: bool, abbreviate: bool):
     """Test the isolate_resource command."""
     schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
     datapack_path = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-    expected_dict = read_json_or_yaml_mapping(
+    expected_dict = read_expected_mapping(
         VALID_DATAPACK_PATHS["simple_relations_rooted.rooted_simple_resources"]
     )
     class_name = "Dataset"
@@ -237,56 +231,44 @@ def test_isolate_resource(json_format: bool, abbreviate: bool):
     assert result.exit_code == exit_codes.SUCCESS == 0
 
     observed_str = result.output
-    assert_formatted_string(observed_str, json_format=json_format)
-
-    observed_dict = loads_json_or_yaml_mapping(observed_str)
+    observed_dict = assert_formatted_string(observed_str, json_format=json_format)
     assert observed_dict == expected_dict
 
 
-def test_isolate_resource_non_existing_class():
-    """Test the isolate_resource command with a non-existing class."""
+def test_isolate_resource_non_existing_class(capsys: pytest.CaptureFixture):
+    """Test the isolate_resource command with a non-existing class. The command function
+    is called directly as the CLI wiring is covered by test_isolate_resource.
+    """
     schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
     datapack_path = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-    class_name = "NonExistingClass"
-    resource_id = "example_dataset_1"
 
-    command = [
-        "isolate-resource",
-        "--schemapack",
-        str(schemapack_path),
-        "--datapack",
-        str(datapack_path),
-        "--class-name",
-        class_name,
-        "--resource-id",
-        resource_id,
-    ]
-    result = runner.invoke(cli, command)
-    assert result.exit_code == exit_codes.CLASS_NOT_FOUND_ERROR != 0
-    assert "ClassNotFoundError" in result.stderr
-
-
-def test_isolate_resource_non_existing_resource():
-    """Test the isolate_resource command with a non-existing resource."""
+    with pytest.raises(typer.Exit) as exit_info:
+        isolate_resource(
+            schemapack=schemapack_path,
+            datapack=datapack_path,
+            class_name="NonExistingClass",
+            resource_id="example_dataset_1",
+        )
+    assert exit_info.value.exit_code == exit_codes.CLASS_NOT_FOUND_ERROR != 0
+    assert "ClassNotFoundError" in capsys.readouterr().err
+
+
+def test_isolate_resource_non_existing_resource(capsys: pytest.CaptureFixture):
+    """Test the isolate_resource command with a non-existing resource. The command
+    function is called directly as the CLI wiring is covered by test_isolate_resource.
+    """
     schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
     datapack_path = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-    class_name = "Dataset"
-    resource_id = "non_existing_resource"
 
-    command = [
-        "isolate-resource",
-        "--schemapack",
-        str(schemapack_path),
-        "--datapack",
-        str(datapack_path),
-        "--class-name",
-        class_name,
-        "--resource-id",
-        resource_id,
-    ]
-    result = runner.invoke(cli, command)
-    assert result.exit_code == exit_codes.RESOURCE_NOT_FOUND_ERROR != 0
-    assert "ResourceNotFoundError" in result.stderr
+    with pytest.raises(typer.Exit) as exit_info:
+        isolate_resource(
+            schemapack=schemapack_path,
+            datapack=datapack_path,
+            class_name="Dataset",
+            resource_id="non_existing_resource",
+        )
+    assert exit_info.value.exit_code == exit_codes.RESOURCE_NOT_FOUND_ERROR != 0
+    assert "ResourceNotFoundError" in capsys.readouterr().err
 
 
 @pytest.mark.parametrize(
@@ -297,7 +279,7 @@ def test_isolate_resource_non_existing_resource():
 def test_isolate_class(json_format: bool, abbreviate: bool):
     """Test the isolate_class command."""
     schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    expected_dict = read_json_or_yaml_mapping(
+    expected_dict = read_expected_mapping(
         VALID_SCHEMAPACK_PATHS["simple_relations_rooted_condensed"]
     )
     class_name = "Dataset"
@@ -315,9 +297,7 @@ def test_isolate_class(json_format: bool, abbreviate: bool):
     assert result.exit_code == exit_codes.SUCCESS == 0
 
     observed_str = result.output
-    assert_formatted_string(observed_str, json_format=json_format)
-
-    observed_dict = loads_json_or_yaml_mapping(observed_str)
+    observed_dict = assert_formatted_string(observed_str, json_format=json_format)
     assert observed_dict == expected_dict
 
 
@@ -360,4 +340,4 @@ def test_export_mermaid(tmp_path, props: list[str], example_suffix: str):
     ]
     result = runner.invoke(cli, args)
     assert result.exit_code == exit_codes.SUCCESS == 0
-    assert result.output == erd.read_text()
+    assert result.output == read_expected_text(erd)
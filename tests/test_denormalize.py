@@ -20,14 +20,12 @@ from pathlib import Path
 
 import pytest
 
-from schemapack import denormalize, load_datapack, load_schemapack
+from schemapack import denormalize
 from schemapack.exceptions import CircularRelationError
-from schemapack.utils import read_json_or_yaml_mapping
-from tests.fixtures.examples import (
-    DENORMALIZED_PATHS,
-    VALID_DATAPACK_PATHS,
-    VALID_SCHEMAPACK_PATHS,
-)
+from schemapack.spec.datapack import DataPack
+from schemapack.spec.schemapack import SchemaPack
+from tests.fixtures.examples import DENORMALIZED_PATHS
+from tests.fixtures.utils import read_expected_mapping
 
 
 @pytest.mark.parametrize(
@@ -35,12 +33,17 @@ from tests.fixtures.examples import (
     DENORMALIZED_PATHS.items(),
     ids=DENORMALIZED_PATHS.keys(),
 )
-def test_denormalize(name: str, expected_denomalizated_path: Path):
+def test_denormalize(
+    name: str,
+    expected_denomalizated_path: Path,
+    parsed_schemapacks: dict[str, SchemaPack],
+    parsed_datapacks: dict[str, DataPack],
+):
     """Test the denormalize function with valid datapacks."""
     schemapack_name = name.split(".")[0]
-    schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS[schemapack_name])
-    datapack = load_datapack(VALID_DATAPACK_PATHS[name])
-    expected_denomalizated = read_json_or_yaml_mapping(expected_denomalizated_path)
+    schemapack = parsed_schemapacks[schemapack_name]
+    datapack = parsed_datapacks[name]
+    expected_denomalizated = read_expected_mapping(expected_denomalizated_path)
 
     denomalizated = denormalize(datapack=datapack, schemapack=schemapack)
 
@@ -54,11 +57,15 @@ def test_denormalize(name: str, expected_denomalizated_path: Path):
         "self_relation_rooted.rooted_circular_self_relations",
     ],
 )
-def test_denormalize_circular_relation(name: str):
+def test_denormalize_circular_relation(
+    name: str,
+    parsed_schemapacks: dict[str, SchemaPack],
+    parsed_datapacks: dict[str, DataPack],
+):
     """Test the denormalize function fails on datapacks with circular relations."""
     schemapack_name = name.split(".")[0]
-    schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS[schemapack_name])
-    datapack = load_datapack(VALID_DATAPACK_PATHS[name])
+    schemapack = parsed_schemapacks[schemapack_name]
+    datapack = parsed_datapacks[name]
 
     with pytest.raises(CircularRelationError):
         _ = denormalize(datapack=datapack, schemapack=schemapack)
@@ -20,88 +20,88 @@ import json
 from pathlib import Path
 
 import pytest
-import ruamel.yaml
 
 from schemapack import (
     dump_schemapack,
     dumps_datapack,
     dumps_schemapack,
-    load_datapack,
-    load_schemapack,
 )
-from schemapack._internals.utils import read_json_or_yaml_mapping
+from schemapack.spec.datapack import DataPack
+from schemapack.spec.schemapack import SchemaPack
 from tests.fixtures.examples import VALID_DATAPACK_PATHS, VALID_SCHEMAPACK_PATHS
 from tests.fixtures.utils import (
     assert_formatted_string,
     loads_json_or_yaml_mapping,
+    read_expected_mapping,
 )
 
-yaml = ruamel.yaml.YAML(typ="rt")
-
 
 @pytest.mark.parametrize(
     "yaml_format", [True, False], ids=["yaml_format", "json_format"]
 )
-def test_dumps_datapack(yaml_format: bool):
+def test_dumps_datapack(yaml_format: bool, parsed_datapacks: dict[str, DataPack]):
     """Tests using the dumps_datapack function."""
     datapack_path = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-    datapack = load_datapack(datapack_path)
-    expected_dict = read_json_or_yaml_mapping(datapack_path)
+    datapack = parsed_datapacks["simple_relations.simple_resources"]
+    expected_dict = read_expected_mapping(datapack_path)
 
     observed_str = dumps_datapack(datapack, yaml_format=yaml_format)
-    assert_formatted_string(observed_str, json_format=not yaml_format)
-
-    observed_dict = loads_json_or_yaml_mapping(observed_str)
+    observed_dict = assert_formatted_string(observed_str, json_format=not yaml_format)
     assert observed_dict == expected_dict
 
 
 @pytest.mark.parametrize(
     "yaml_format", [True, False], ids=["yaml_format", "json_format"]
 )
-def test_dumps_schemapack(yaml_format: bool):
+def test_dumps_schemapack(yaml_format: bool, parsed_schemapacks: dict[str, SchemaPack]):
     """Tests using the dumps_schemapack function to dump a schemapack as a
     condensed representation to string.
     """
-    schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS["simple_relations"])
-    expected_dict = read_json_or_yaml_mapping(
+    schemapack = parsed_schemapacks["simple_relations"]
+    expected_dict = read_expected_mapping(
         VALID_SCHEMAPACK_PATHS["simple_relations_condensed"]
     )
 
     observed_str = dumps_schemapack(schemapack, yaml_format=yaml_format)
-    assert_formatted_string(observed_str, json_format=not yaml_format)
-
-    observed_dict = loads_json_or_yaml_mapping(observed_str)
+    observed_dict = assert_formatted_string(observed_str, json_format=not yaml_format)
     assert observed_dict == expected_dict
 
 
 @pytest.mark.parametrize(
     "yaml_format", [True, False], ids=["yaml_format", "json_format"]
 )
-def test_dump_condensed_schemapack(yaml_format: bool, tmp_path: Path):
+def test_dump_condensed_schemapack(
+    yaml_format: bool, tmp_path: Path, parsed_schemapacks: dict[str, SchemaPack]
+):
     """Tests using the dump_schemapack function to dump a schemapack as a
     condensed representation to file.
     """
-    input_schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS["simple_relations"])
-    expected_dict = yaml.load(VALID_SCHEMAPACK_PATHS["simple_relations_condensed"])
+    input_schemapack = parsed_schemapacks["simple_relations"]
+    expected_dict = read_expected_mapping(
+        VALID_SCHEMAPACK_PATHS["simple_relations_condensed"]
+    )
     output_path = tmp_path / "output.schemapack.yaml"
 
     dump_schemapack(input_schemapack, path=output_path, yaml_format=yaml_format)
     if yaml_format:
-        observed_dict = yaml.load(output_path)
+        observed_dict = loads_json_or_yaml_mapping(
+            output_path.read_text(encoding="utf-8")
+        )
     else:
-        with open(output_path, encoding="utf-8") as file:
-            observed_dict = json.load(file)
+        observed_dict = json.loads(output_path.read_bytes())
 
     assert observed_dict == expected_dict
 
 
-def test_dump_not_condensed_schemapack(tmp_path: Path):
+def test_dump_not_condensed_schemapack(
+    tmp_path: Path, parsed_schemapacks: dict[str, SchemaPack]
+):
     """Tests using the dump_schemapack function to dump a schemapack as a representation
     to file with content schemas being written to dedicated files.
     """
     input_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    input_schemapack = load_schemapack(input_path)
-    expected_dict = yaml.load(input_path)
+    input_schemapack = parsed_schemapacks["simple_relations"]
+    expected_dict = read_expected_mapping(input_path)
     schemapack_dir = tmp_path / "schemapack" / "valid"
     output_path = schemapack_dir / "output.schemapack.yaml"
     rel_content_schema_path = Path("../../content_schemas/")
@@ -116,15 +116,16 @@ def test_dump_not_condensed_schemapack(tmp_path: Path):
     )
 
     # check schemapack file itself:
-    observed_dict = yaml.load(output_path)
+    observed_dict = loads_json_or_yaml_mapping(output_path.read_text(encoding="utf-8"))
     assert observed_dict == expected_dict
 
     # check content schema files:
-    for class_name, class_ in input_schemapack.classes.items():
-        content_schema_path = (
-            schemapack_dir / rel_content_schema_path / f"{class_name}.schema.json"
-        )
-        with open(content_schema_path, encoding="utf-8") as file:
-            observed_content_schema = json.load(file)
-        expected_content_schema = json.loads(class_.model_dump_json())["content"]
+    expected_content_schemas = {
+        class_name: json.loads(class_.model_dump_json(include={"content"}))["content"]
+        for class_name, class_ in input_schemapack.classes.items()
+    }
+    content_schema_dir = schemapack_dir / rel_content_schema_path
+    for class_name, expected_content_schema in expected_content_schemas.items():
+        content_schema_path = content_schema_dir / f"{class_name}.schema.json"
+        observed_content_schema = json.loads(content_schema_path.read_bytes())
         assert observed_content_schema == expected_content_schema
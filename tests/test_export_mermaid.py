@@ -18,8 +18,10 @@
 
 import pytest
 
-from schemapack import export_mermaid, load_schemapack
-from tests.fixtures.examples import ERD_PATHS, VALID_SCHEMAPACK_PATHS
+from schemapack import export_mermaid
+from schemapack.spec.schemapack import SchemaPack
+from tests.fixtures.examples import ERD_PATHS
+from tests.fixtures.utils import read_expected_text
 
 
 @pytest.mark.parametrize(
@@ -27,15 +29,18 @@ from tests.fixtures.examples import ERD_PATHS, VALID_SCHEMAPACK_PATHS
     [(True, "_w_props"), (False, "_wo_props")],
     ids=("content_props", "no_content_props"),
 )
-def test_export_mermaid(with_properties: bool, file_suffix: str):
+def test_export_mermaid(
+    with_properties: bool,
+    file_suffix: str,
+    parsed_schemapacks: dict[str, SchemaPack],
+):
     """Test dumping a schemapack in mermaid format."""
     example = "comprehensive_cardinalities_and_types"
-    schemapack_path = VALID_SCHEMAPACK_PATHS[example]
-    schemapack = load_schemapack(schemapack_path)
+    schemapack = parsed_schemapacks[example]
 
     erd_path = ERD_PATHS[example + file_suffix]
 
     observed_output = export_mermaid(
         schemapack=schemapack, content_properties=with_properties
     )
-    assert observed_output == erd_path.read_text().strip()
+    assert observed_output == read_expected_text(erd_path).strip()
@@ -23,11 +23,10 @@ from schemapack import (
     isolate,
     isolate_class,
     isolate_resource,
-    load_datapack,
-    load_schemapack,
 )
 from schemapack.spec.custom_types import ClassName, ResourceId
-from tests.fixtures.examples import VALID_DATAPACK_PATHS, VALID_SCHEMAPACK_PATHS
+from schemapack.spec.datapack import DataPack
+from schemapack.spec.schemapack import SchemaPack
 
 
 @pytest.mark.parametrize(
@@ -77,19 +76,17 @@ def test_isolate(
     resource_class: ClassName,
     resource_id: ResourceId,
     rooted_datapack_name: str,
+    parsed_schemapacks: dict[str, SchemaPack],
+    parsed_datapacks: dict[str, DataPack],
 ):
     """Test the isolate function."""
-    datapack_path = VALID_DATAPACK_PATHS[datapack_name]
-    expected_rooted_datapack_path = VALID_DATAPACK_PATHS[rooted_datapack_name]
     schemapack_name = datapack_name.split(".")[0]
-    schemapack_path = VALID_SCHEMAPACK_PATHS[schemapack_name]
     rooted_schempack_name = rooted_datapack_name.split(".")[0]
-    expected_rooted_schemapack_path = VALID_SCHEMAPACK_PATHS[rooted_schempack_name]
 
-    datapack = load_datapack(datapack_path)
-    expected_rooted_datapack = load_datapack(expected_rooted_datapack_path)
-    schemapack = load_schemapack(schemapack_path)
-    expected_rooted_schemapack = load_schemapack(expected_rooted_schemapack_path)
+    datapack = parsed_datapacks[datapack_name]
+    expected_rooted_datapack = parsed_datapacks[rooted_datapack_name]
+    schemapack = parsed_schemapacks[schemapack_name]
+    expected_rooted_schemapack = parsed_schemapacks[rooted_schempack_name]
 
     rooted_schemapack, rooted_datapack = isolate(
         class_name=resource_class,
@@ -102,12 +99,12 @@ def test_isolate(
     assert rooted_datapack == expected_rooted_datapack
 
 
-def test_isolate_with_non_existing_class():
+def test_isolate_with_non_existing_class(
+    parsed_schemapacks: dict[str, SchemaPack], parsed_datapacks: dict[str, DataPack]
+):
     """Test the isolate function with a non-existing class."""
-    schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    datapack_path = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-    schemapack = load_schemapack(schemapack_path)
-    datapack = load_datapack(datapack_path)
+    schemapack = parsed_schemapacks["simple_relations"]
+    datapack = parsed_datapacks["simple_relations.simple_resources"]
 
     with pytest.raises(exceptions.ClassNotFoundError) as error:
         isolate(
@@ -119,12 +116,12 @@ def test_isolate_with_non_existing_class():
     assert "schemapack" in str(error)
 
 
-def test_isolate_with_non_existing_resource():
+def test_isolate_with_non_existing_resource(
+    parsed_schemapacks: dict[str, SchemaPack], parsed_datapacks: dict[str, DataPack]
+):
     """Test the isolate function with a non-existing resource."""
-    schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    datapack_path = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-    schemapack = load_schemapack(schemapack_path)
-    datapack = load_datapack(datapack_path)
+    schemapack = parsed_schemapacks["simple_relations"]
+    datapack = parsed_datapacks["simple_relations.simple_resources"]
 
     with pytest.raises(exceptions.ResourceNotFoundError):
         isolate(
@@ -135,15 +132,15 @@ def test_isolate_with_non_existing_resource():
         )
 
 
-def test_isolate_resource_non_exisiting_class():
+def test_isolate_resource_non_exisiting_class(
+    parsed_schemapacks: dict[str, SchemaPack], parsed_datapacks: dict[str, DataPack]
+):
     """Test the isolate_resource function with a non-existing class. Happy paths are
     tested as part of the isolate function and appear not worth repeating for this
     specific function.
     """
-    schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    datapack_path = VALID_DATAPACK_PATHS["simple_relations.simple_resources"]
-    schemapack = load_schemapack(schemapack_path)
-    datapack = load_datapack(datapack_path)
+    schemapack = parsed_schemapacks["simple_relations"]
+    datapack = parsed_datapacks["simple_relations.simple_resources"]
 
     with pytest.raises(exceptions.ClassNotFoundError):
         isolate_resource(
@@ -154,13 +151,12 @@ def test_isolate_resource_non_exisiting_class():
         )
 
 
-def test_isolate_class_non_exisiting_class():
+def test_isolate_class_non_exisiting_class(parsed_schemapacks: dict[str, SchemaPack]):
     """Test the isolate_class function with a non-existing class. Happy paths are
     tested as part of the isolate function and appear not worth repeating for this
     specific function.
     """
-    schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations"]
-    schemapack = load_schemapack(schemapack_path)
+    schemapack = parsed_schemapacks["simple_relations"]
 
     with pytest.raises(exceptions.ClassNotFoundError):
         isolate_class(
@@ -169,12 +165,10 @@ def test_isolate_class_non_exisiting_class():
         )
 
 
-def test_isolate_class_downscoping():
+def test_isolate_class_downscoping(parsed_schemapacks: dict[str, SchemaPack]):
     """Test that unrelated classes are not included in the isolated schemapack."""
-    schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS["unrelated_classes"])
-    expected_schemapack = load_schemapack(
-        VALID_SCHEMAPACK_PATHS["unrelated_classes_rooted"]
-    )
+    schemapack = parsed_schemapacks["unrelated_classes"]
+    expected_schemapack = parsed_schemapacks["unrelated_classes_rooted"]
 
     observed_schemapack = isolate_class(class_name="SomeClass", schemapack=schemapack)
     assert observed_schemapack == expected_schemapack
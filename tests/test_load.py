@@ -22,7 +22,12 @@ import pytest
 
 from schemapack import load_datapack, load_schemapack
 from schemapack._internals.spec.schemapack import ClassDefinition
-from schemapack.exceptions import DataPackSpecError, ParsingError, SchemaPackSpecError
+from schemapack.exceptions import (
+    BaseError,
+    DataPackSpecError,
+    ParsingError,
+    SchemaPackSpecError,
+)
 from tests.fixtures.examples import (
     INVALID_DATAPACK_PATHS,
     INVALID_SCHEMAPACK_PATHS,
@@ -46,12 +51,12 @@ def test_load_schemapack_valid(path: Path):
 
 
 @pytest.mark.parametrize(
-    "name, path", INVALID_SCHEMAPACK_PATHS.items(), ids=INVALID_SCHEMAPACK_PATHS
+    "error_type, path",
+    [(name.split(".", 1)[0], path) for name, path in INVALID_SCHEMAPACK_PATHS.items()],
+    ids=INVALID_SCHEMAPACK_PATHS,
 )
-def test_load_schemapack_invalid(name: str, path: Path):
+def test_load_schemapack_invalid(error_type: str, path: Path):
     """Test loading invalid schemapacks."""
-    error_type = name.split(".")[0]
-
     with pytest.raises(SchemaPackSpecError) as exception_info:
         _ = load_schemapack(path)
 
@@ -69,20 +74,30 @@ def test_load_datapack_valid(path: Path):
     _ = load_datapack(path)
 
 
+def get_expected_load_error(datapack_name: str) -> type[BaseError] | None:
+    """Get the error expected when loading the invalid datapack with the given name
+    (formatted as "schemapack_name.error_type.example_name"). Returns None for
+    datapacks that comply with the specs but fail the validation against the
+    schemapack.
+    """
+    error_type = datapack_name.split(".", 2)[1]
+    if error_type == "DataPackSpecError":
+        return DataPackSpecError
+    if error_type == "ParsingError":
+        return ParsingError
+    return None
+
+
 @pytest.mark.parametrize(
-    "name, path", INVALID_DATAPACK_PATHS.items(), ids=INVALID_DATAPACK_PATHS
+    "expected_error, path",
+    [
+        (get_expected_load_error(name), path)
+        for name, path in INVALID_DATAPACK_PATHS.items()
+    ],
+    ids=INVALID_DATAPACK_PATHS,
 )
-def test_load_datapack_invalid(name: str, path: Path):
+def test_load_datapack_invalid(expected_error: type[BaseError] | None, path: Path):
     """Test loading invalid datapacks."""
-    error_type = name.split(".")[1]
-    expected_error = (
-        DataPackSpecError
-        if error_type == "DataPackSpecError"
-        else ParsingError
-        if error_type == "ParsingError"
-        else None
-    )
-
     with pytest.raises(expected_error) if expected_error else nullcontext():
         _ = load_datapack(path)
 
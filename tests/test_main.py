@@ -17,16 +17,19 @@
 """Tests the main module."""
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from schemapack import load_and_validate
+from schemapack import SchemaPackValidator, load_and_validate
 from schemapack.exceptions import (
     BaseError,
     DataPackSpecError,
     ParsingError,
     ValidationError,
 )
+from schemapack.spec.datapack import SUPPORTED_DATA_PACK_VERSIONS, DataPack
+from schemapack.spec.schemapack import SUPPORTED_SCHEMA_PACK_VERSIONS, SchemaPack
 from tests.fixtures.examples import (
     INVALID_DATAPACK_PATHS,
     VALID_DATAPACK_PATHS,
@@ -34,25 +37,33 @@ from tests.fixtures.examples import (
 )
 
 
+def get_schemapack_path(datapack_name: str) -> Path:
+    """Get the path to the schemapack that the datapack with the given name
+    (formatted as "schemapack_name.example_name") is based on.
+    """
+    return VALID_SCHEMAPACK_PATHS[datapack_name.split(".", 1)[0]]
+
+
 @pytest.mark.parametrize(
-    "name, path", VALID_DATAPACK_PATHS.items(), ids=VALID_DATAPACK_PATHS
+    "schemapack_path, path",
+    [(get_schemapack_path(name), path) for name, path in VALID_DATAPACK_PATHS.items()],
+    ids=VALID_DATAPACK_PATHS,
 )
-def test_load_and_validate_valid(name: str, path: Path):
+def test_load_and_validate_valid(schemapack_path: Path, path: Path):
     """Test load_and_validate function with valid schemapack and valid datapacks."""
-    schemapack_name = name.split(".", 1)[0]
-    schemapack_path = VALID_SCHEMAPACK_PATHS[schemapack_name]
-
     _ = load_and_validate(schemapack_path=schemapack_path, datapack_path=path)
 
 
 @pytest.mark.parametrize(
-    "name, path", INVALID_DATAPACK_PATHS.items(), ids=INVALID_DATAPACK_PATHS
+    "error_type, schemapack_path, path",
+    [
+        (name.split(".", 2)[1], get_schemapack_path(name), path)
+        for name, path in INVALID_DATAPACK_PATHS.items()
+    ],
+    ids=INVALID_DATAPACK_PATHS,
 )
-def test_load_and_validate_invalid(name: str, path: Path):
+def test_load_and_validate_invalid(error_type: str, schemapack_path: Path, path: Path):
     """Test load_and_validate function with valid schemapack but invalid datapacks."""
-    schemapack_name, error_type = name.split(".", 2)[:2]
-    schemapack_path = VALID_SCHEMAPACK_PATHS[schemapack_name]
-
     with pytest.raises(BaseError) as exception_info:
         _ = load_and_validate(schemapack_path=schemapack_path, datapack_path=path)
 
@@ -66,3 +77,64 @@ def test_load_and_validate_invalid(name: str, path: Path):
         error_records = exception_info.value.records
         assert len(error_records) == 1
         assert error_records[0].type == error_type
+
+
+def test_target_id_not_found_via_multiple_relations():
+    """Test that a non-existing target ID referenced via multiple relations of the
+    same resource is reported for each of these relations.
+    """
+    with pytest.raises(ValidationError) as exception_info:
+        _ = load_and_validate(
+            schemapack_path=VALID_SCHEMAPACK_PATHS["complex_cardinality"],
+            datapack_path=INVALID_DATAPACK_PATHS[
+                "complex_cardinality.TargetIdNotFoundError.multiple_relations"
+            ],
+        )
+
+    error_records = exception_info.value.records
+    assert len(error_records) == 1
+    details = error_records[0].details
+    assert details["non_found_target_ids"] == ["not_existing_b", "not_existing_b"]
+    assert sorted(details["corresponding_relation_names"]) == [
+        "many_to_many",
+        "many_to_one",
+    ]
+
+
+def get_const_schemapack(const: Any) -> SchemaPack:
+    """Get a schemapack with a single class whose content property "x" must be equal
+    to the given constant.
+    """
+    return SchemaPack.model_validate(
+        {
+            "schemapack": SUPPORTED_SCHEMA_PACK_VERSIONS[-1],
+            "classes": {
+                "TestClass": {
+                    "id": {"propertyName": "alias"},
+                    "content": {
+                        "type": "object",
+                        "properties": {"x": {"const": const}},
+                    },
+                }
+            },
+        }
+    )
+
+
+def test_validate_content_schemas_differing_in_bool_and_int():
+    """Test that content schemas only differing in a boolean vs. an integer value
+    (which are equal in Python but not in JSON Schema) are not mixed up.
+    """
+    datapack = DataPack.model_validate(
+        {
+            "datapack": SUPPORTED_DATA_PACK_VERSIONS[-1],
+            "resources": {"TestClass": {"test_resource": {"content": {"x": 1}}}},
+        }
+    )
+
+    SchemaPackValidator(schemapack=get_const_schemapack(1)).validate(datapack=datapack)
+
+    with pytest.raises(ValidationError):
+        SchemaPackValidator(schemapack=get_const_schemapack(True)).validate(
+            datapack=datapack
+        )
@@ -20,45 +20,42 @@ import json
 
 from immutabledict import immutabledict
 
-from schemapack import load_schemapack
-from schemapack._internals.load import load_datapack
-from schemapack._internals.utils import read_json_or_yaml_mapping
 from schemapack.spec.datapack import (
     SUPPORTED_DATA_PACK_VERSIONS,
     DataPack,
 )
-from tests.fixtures.examples import VALID_DATAPACK_PATHS, VALID_SCHEMAPACK_PATHS
+from schemapack.spec.schemapack import SchemaPack
+from tests.fixtures.examples import VALID_SCHEMAPACK_PATHS
+from tests.fixtures.utils import read_expected_mapping
 
 
-def test_schemapack_is_hashable():
+def test_schemapack_is_hashable(parsed_schemapacks: dict[str, SchemaPack]):
     """Test that instances of SchemaPack are hashable."""
-    schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS["simple_relations"])
+    schemapack = parsed_schemapacks["simple_relations"]
     _ = hash(schemapack)
 
 
-def test_comparison_and_hashing():
+def test_comparison_and_hashing(parsed_schemapacks: dict[str, SchemaPack]):
     """Test that equivalent schemapack (content schemas embedded or not) have the same
     hash and are equal.
     """
-    schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS["simple_relations"])
-    schemapack_condensed = load_schemapack(
-        VALID_SCHEMAPACK_PATHS["simple_relations_condensed"]
-    )
+    schemapack = parsed_schemapacks["simple_relations"]
+    schemapack_condensed = parsed_schemapacks["simple_relations_condensed"]
 
     assert hash(schemapack) == hash(schemapack_condensed)
     assert schemapack == schemapack_condensed
 
 
-def test_comparison_and_hashing_different():
+def test_comparison_and_hashing_different(parsed_schemapacks: dict[str, SchemaPack]):
     """Test that different SchemaPack instances have different hashes and are unequal."""
-    schemapack = load_schemapack(VALID_SCHEMAPACK_PATHS["simple_relations"])
+    schemapack = parsed_schemapacks["simple_relations"]
 
     schemapack_modified = schemapack.model_copy(
         update={
             "classes": immutabledict(
                 {
                     "AdditionalClass": schemapack.classes[
-                        set(schemapack.classes).pop()
+                        next(iter(schemapack.classes))
                     ],
                     **schemapack.classes,
                 }
@@ -70,11 +67,11 @@ def test_comparison_and_hashing_different():
     assert schemapack != schemapack_modified
 
 
-def test_content_schema_serialization():
+def test_content_schema_serialization(parsed_schemapacks: dict[str, SchemaPack]):
     """Test that content schemas of a schemapack are serialized as dicts."""
     schemapack_path = VALID_SCHEMAPACK_PATHS["simple_relations_condensed"]
-    schemapack = load_schemapack(schemapack_path)
-    expected_schemapack_dict = read_json_or_yaml_mapping(schemapack_path)
+    schemapack = parsed_schemapacks["simple_relations_condensed"]
+    expected_schemapack_dict = read_expected_mapping(schemapack_path)
 
     serialized_schemapack = json.loads(schemapack.model_dump_json())
 
@@ -85,9 +82,9 @@ def test_content_schema_serialization():
         )
 
 
-def test_datapack_is_hashable():
+def test_datapack_is_hashable(parsed_datapacks: dict[str, DataPack]):
     """Test that instances of DataPack are hashable."""
-    datapack = load_datapack(VALID_DATAPACK_PATHS["simple_relations.simple_resources"])
+    datapack = parsed_datapacks["simple_relations.simple_resources"]
     _ = hash(datapack)
 
 